@@ -34,14 +34,7 @@ if __name__ == "__main__":
     result = AnonymizationManager.anonymize(config)
     result.store_as_csv("examples/arx_example/results/anonymized.csv")
     print("-----------------------> [Metrics] <-----------------------")
-    print("Average Class Size : ", result.get_average_equivalence_class_size())
-    print("Max Class Size : ", result.get_max_equivalence_class_size())
-    print("Min Class Size : ", result.get_min_equivalence_class_size())
-    print(
-        "Average Class Size Metric: ", result.get_average_class_size_metric()
-    )
-    print(
-        "Record Level Squared Error: ",
-        result.get_record_level_squared_error_metric(),
-    )
+    # Reads every dataset-level metric from ARX in one call.
+    for name, value in result.get_all_metrics().items():
+        print(f"{name} : {value}")
     print("-----------------------> [Metrics] <-----------------------")
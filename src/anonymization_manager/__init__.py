@@ -1,4 +1,4 @@
-from .config import AnonymizationConfig
+from .config import AnonymizationConfig, config_context
 from .core import AnonymizationManager
 
-__all__ = ["AnonymizationManager", "AnonymizationConfig"]
+__all__ = ["AnonymizationManager", "AnonymizationConfig", "config_context"]
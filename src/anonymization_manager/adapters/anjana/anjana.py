@@ -2,14 +2,70 @@
 The Anonymization Manager's adapter for the ANJANA library backend.
 """
 
+import os
 import time
+from functools import cached_property, lru_cache
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 from anjana.anonymity import k_anonymity, l_diversity, t_closeness, utils
+from pandas.core.groupby import DataFrameGroupBy
 
 from anonymization_manager.config import AnonymizationConfig
 
 
+def _read_dataset(path: str | pd.DataFrame) -> pd.DataFrame:
+    """
+    Reads the dataset and strips the whitespace around names and values.
+
+    An in-memory DataFrame is copied instead, so ANJANA never modifies the
+    caller's frame.
+    """
+    if isinstance(path, pd.DataFrame):
+        return path.copy()
+
+    # TODO add filetype check (do not assume csv)
+    # Lets the C parser drop the padding after each delimiter.
+    data = pd.read_csv(path, skipinitialspace=True)
+    data.columns = data.columns.str.strip()
+    string_cols = data.select_dtypes(include=["object", "string"]).columns
+    for col in string_cols:
+        # Strips each distinct value once and skips columns without padding.
+        codes, uniques = pd.factorize(data[col])
+        stripped = uniques.str.strip()
+        if not stripped.equals(uniques):
+            data[col] = stripped.take(codes, allow_fill=True, fill_value=np.nan)
+    return data
+
+
+@lru_cache(maxsize=256)
+def _load_hierarchy(path: str, mtime_ns: int) -> dict[int, pd.Series]:
+    """
+    Parses a hierarchy CSV into the level mapping expected by ANJANA.
+
+    The path is canonical and the modification time is part of the cache
+    key, so neither a relative path resolved from another directory nor an
+    edited hierarchy file is served stale.
+    """
+    return dict(pd.read_csv(path, header=None))
+
+
+def _load_hierarchies(hierarchies: dict[str, str]) -> dict[str, dict]:
+    """
+    Returns the parsed hierarchies for every quasi-identifier.
+
+    Each level mapping is copied, since ANJANA may replace its levels in
+    place and the cached parse must stay untouched.
+    """
+    loaded = {}
+    for key, path in hierarchies.items():
+        path = os.path.realpath(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        loaded[key] = dict(_load_hierarchy(path, mtime_ns))
+    return loaded
+
+
 class AnjanaResult:
     """
     Wrapper class for Anjana's anonymized results.
@@ -18,15 +74,16 @@ class AnjanaResult:
     def __init__(
         self,
         result: pd.DataFrame,
-        raw: pd.DataFrame,
+        raw_size: int,
         config: AnonymizationConfig,
         time: int,
     ):
         self.result = result
-        self.raw = raw
+        self.raw_size = raw_size
         self.config = config
         self.time = time
-        self.quasi_identifiers = config.quasi_identifiers
+        self.quasi_identifiers = tuple(config.quasi_identifiers)
+        self._qi_list = list(self.quasi_identifiers)
 
     def get_anonymized_data_as_dataframe(self) -> pd.DataFrame:
         """
@@ -36,31 +93,52 @@ class AnjanaResult:
 
     def get_raw_data_as_dataframe(self) -> pd.DataFrame:
         """
-        Returns the original dataset as a dataframe.
+        Returns the original dataset as a dataframe, read again from disk or
+        copied from the in-memory frame.
+        """
+        return _read_dataset(self.config.data)
+
+    def get_anonymized_head(
+        self, n: int = 10, infer_dtypes: bool = True
+    ) -> pd.DataFrame:
         """
-        return self.raw
+        Returns a copy of the first `n` rows of the anonymized dataset.
+
+        `infer_dtypes` is accepted for parity with the ARX adapter. The ANJANA
+        result is already a typed DataFrame, so it has no effect.
+        """
+        return self.result.iloc[:n].copy()
+
+    def iter_rows(self) -> Iterator[list]:
+        """
+        Streams the anonymized dataset row by row, in column order.
+        """
+        for row in self.result.itertuples(index=False, name=None):
+            yield list(row)
 
     def get_transformations(self) -> dict[str, int]:
         """
         Returns the transformations applied to each quasi-identifier.
         """
-        hierarchies = {
-            key: dict(pd.read_csv(path, header=None))
-            for key, path in self.config.hierarchies.items()
-        }
+        hierarchies = _load_hierarchies(self.config.hierarchies)
 
-        qi: list[str] = self.quasi_identifiers
+        qi: list[str] = self._qi_list
         transformations: list[int] = utils.get_transformation(
             self.result, qi, hierarchies
         )
 
         return dict(zip(qi, transformations))
 
-    def store_as_csv(self, output_path: str) -> None:
+    def store_as_csv(
+        self, output_path: str, chunksize: int | None = None
+    ) -> None:
         """
-        Stores the anonymized dataset as .csv file.
+        Stores the anonymized dataset as .csv file, without the index column.
+
+        The rows are serialized `chunksize` at a time, which bounds the memory
+        used by the writer. By default pandas picks the chunk size.
         """
-        self.result.to_csv(output_path)
+        self.result.to_csv(output_path, index=False, chunksize=chunksize)
 
     def get_anonymization_time(self) -> int:
         """
@@ -68,50 +146,70 @@ class AnjanaResult:
         """
         return self.time
 
-    # HACK?
+    def _group_by_quasi_identifiers(self) -> DataFrameGroupBy:
+        """
+        Groups the anonymized data into its equivalence classes.
+
+        Only observed combinations are kept and the keys are not sorted, so
+        categorical quasi-identifiers never expand into their full product.
+        """
+        return self.result.groupby(self._qi_list, sort=False, observed=True)
+
+    @cached_property
+    def _equivalence_class_sizes(self) -> np.ndarray:
+        """
+        Returns the size of every equivalence class, grouped only once.
+
+        When every record was suppressed ANJANA returns an empty frame,
+        possibly without columns, which has no classes at all.
+        """
+        if self.result.empty:
+            return np.empty(0, dtype=np.int64)
+        sizes = self._group_by_quasi_identifiers().size()
+        return sizes.to_numpy(dtype=np.int64)
+
     def get_average_equivalence_class_size(self) -> float:
         """
         Returns the average equivalence class size.
         """
-        eq_classes = self.result.groupby(list(self.quasi_identifiers)).size()
-        return float(eq_classes.mean())
+        n_classes = self.get_number_of_equivalence_classes()
+        if not n_classes:
+            return 0.0
+        return float(self._equivalence_class_sizes.sum() / n_classes)
 
     def get_number_of_suppressed_records(self) -> int:
         """
         Returns the number of suppressed records, i.e. removed from the dataset.
         """
-        # Suppressed = original rows not in anonymized (by index)
-        return len(self.raw) - len(self.result)
+        return self.raw_size - len(self.result)
 
-    # TODO
     def get_max_equivalence_class_size(self) -> int:
         """
         Returns the maximum size of an equivalence class present in the anonymized dataset.
         """
-        ...
+        if not self._equivalence_class_sizes.size:
+            return 0
+        return int(self._equivalence_class_sizes.max())
 
-    # TODO
     def get_min_equivalence_class_size(self) -> int:
         """
         Returns the minimum size of an equivalence class present in the anonymized dataset.
         """
-        ...
+        if not self._equivalence_class_sizes.size:
+            return 0
+        return int(self._equivalence_class_sizes.min())
 
-    # TODO
     def get_number_of_equivalence_classes(self) -> int:
         """
         Returns the number of equivalence classes present in the anonymized dataset.
         """
-        ...
+        return int(self._equivalence_class_sizes.size)
 
-    # TODO
     def get_discernibility_metric(self) -> float:
         """
         Returns the discernibility metric for the anonymized dataset.
         """
-        ...
-        eq_classes = self.result.groupby(list(self.quasi_identifiers)).size()
-        return np.sum(eq_classes**2)
+        return float(np.square(self._equivalence_class_sizes).sum())
 
     # TODO
     def get_average_class_size_metric(self) -> float:
@@ -190,48 +288,36 @@ class AnjanaAnonymizer:
             AnjanaResult: An instance of the wrapper class AnjanaResult.
         """
         # TODO add function that handles multiple file-types (common among adapters)
-        ## TODO add filetype check (do not assume csv)
-        data = pd.read_csv(config.data)
-        data.columns = data.columns.str.strip()
-        string_cols = data.select_dtypes(include=["object", "string"]).columns
-        data[string_cols] = data[string_cols].apply(lambda x: x.str.strip())
-        raw_data = data.copy()
-        ident = config.identifiers
-        quasi_ident = config.quasi_identifiers
+        data = _read_dataset(config.data)
+        raw_size = len(data)
+        # ANJANA indexes the frame with these, so they must be lists.
+        ident = list(config.identifiers or ())
+        quasi_ident = list(config.quasi_identifiers or ())
         # TODO Only 1 sensitive attribute supported right now
-        if len(config.sensitive_attributes) > 0:
-            sens_att = config.sensitive_attributes[0]
-        else:
-            sens_att = ""
+        sens_att = (config.sensitive_attributes or [""])[0]
 
-        k = config.k
+        # The config already validated the types, so no coercion is needed.
+        k = config.k or 1
         l = config.l
         t = config.t
 
         # Anjana supports integer limits in [1-100]
-        supp_level = config.suppression_limit or 0.0
-        supp_level = int(round(supp_level*100))
+        supp_level = int(round((config.suppression_limit or 0.0) * 100))
 
-        hierarchies = config.hierarchies
-        hierarchies = {
-            key: dict(pd.read_csv(path, header=None))
-            for key, path in hierarchies.items()
-        }
+        # Parsing the hierarchies is I/O, so it stays outside the timing.
+        hierarchies = _load_hierarchies(config.hierarchies)
 
         ##### Start of anonymization pipeline #####
         start = time.perf_counter()
 
         # k-anonymity
-        if k is None:
-            k = 1
-        elif k > 1:
+        if k > 1:
             data = k_anonymity(
                 data, ident, quasi_ident, k, supp_level, hierarchies
             )
 
         # l-diversity
         if l is not None:
-            l = int(l)
             data = l_diversity(
                 data,
                 ident,
@@ -259,4 +345,4 @@ class AnjanaAnonymizer:
         end = time.perf_counter()
         elapsed_ms = int((end - start) * 1000)
 
-        return AnjanaResult(data, raw_data, config, elapsed_ms)
+        return AnjanaResult(data, raw_size, config, elapsed_ms)
@@ -1,12 +1,75 @@
+import io
 import os
+from functools import cached_property, lru_cache
+from itertools import islice
 
 import jpype
+import numpy as np
 import pandas as pd
-from typing import Any
+from typing import Any, Iterator
 from jpype import JClass
 
 from anonymization_manager.config import AnonymizationConfig
 
+# Above this many cells a data handle is converted through a CSV buffer.
+_CSV_THRESHOLD = 50_000
+
+# ASCII unit separator, used to join the values of an output row.
+_ROW_SEPARATOR = "\x1f"
+
+
+@lru_cache(maxsize=None)
+def _java_class(name: str) -> JClass:
+    """
+    Resolves a Java class by name once, after the JVM has started.
+    """
+    return JClass(name)
+
+
+@lru_cache(maxsize=None)
+def _utf8() -> JClass:
+    """
+    Returns the UTF-8 Java charset used to read datasets and hierarchies.
+    """
+    return _java_class("java.nio.charset.Charset").forName("UTF-8")
+
+
+@lru_cache(maxsize=256)
+def _load_hierarchy(path: str, mtime_ns: int) -> JClass:
+    """
+    Parses a hierarchy CSV into an ARX Hierarchy object.
+
+    The path is canonical and the modification time is part of the cache
+    key, so neither a relative path resolved from another directory nor an
+    edited hierarchy file is served stale.
+    """
+    Hierarchy = _java_class("org.deidentifier.arx.AttributeType.Hierarchy")
+    return Hierarchy.create(path, _utf8(), ",")
+
+
+@lru_cache(maxsize=None)
+def _arx_anonymizer() -> JClass:
+    """
+    Returns the Java ARXAnonymizer, which is reused across anonymizations.
+    """
+    return _java_class("org.deidentifier.arx.ARXAnonymizer")()
+
+
+def _csv_strings(column: pd.Series) -> list[str]:
+    """
+    Formats the values of a column the way they read from a CSV file.
+
+    Missing values become empty strings. A float column of whole numbers,
+    which is what pandas makes of an integer column with a missing value,
+    is written without the trailing ".0" so it still matches the hierarchy.
+    """
+    missing = column.isna()
+    if pd.api.types.is_float_dtype(column):
+        present = column[~missing].to_numpy()
+        if np.isfinite(present).all() and (present == np.round(present)).all():
+            column = column.astype("Int64")
+    return column.astype(str).mask(missing, "").tolist()
+
 
 class ARXAnonymizerException(Exception):
     """
@@ -16,6 +79,60 @@ class ARXAnonymizerException(Exception):
     pass
 
 
+class _EquivalenceClassStatistics:
+    """
+    Python view of ARX's equivalence class statistics.
+
+    Each value is read from Java on first access and kept as a native Python
+    number, since the statistics never change after anonymization.
+    """
+
+    def __init__(self, java_statistics) -> None:
+        """
+        Initializes the view.
+
+        Args:
+            java_statistics (jpype._jclass.org.deidentifier.arx.aggregates.
+                StatisticsEquivalenceClasses): The Java statistics object.
+        """
+        self._statistics = java_statistics
+
+    @cached_property
+    def average_size(self) -> float:
+        """
+        The average equivalence class size.
+        """
+        return float(self._statistics.getAverageEquivalenceClassSize())
+
+    @cached_property
+    def suppressed_records(self) -> int:
+        """
+        The number of suppressed records.
+        """
+        return int(self._statistics.getNumberOfSuppressedRecords())
+
+    @cached_property
+    def max_size(self) -> int:
+        """
+        The maximum equivalence class size.
+        """
+        return int(self._statistics.getMaximalEquivalenceClassSize())
+
+    @cached_property
+    def min_size(self) -> int:
+        """
+        The minimum equivalence class size.
+        """
+        return int(self._statistics.getMinimalEquivalenceClassSize())
+
+    @cached_property
+    def count(self) -> int:
+        """
+        The number of equivalence classes.
+        """
+        return int(self._statistics.getNumberOfEquivalenceClasses())
+
+
 class ARXResult:
     """
     Wrapper for the ARX Java Result object.
@@ -33,6 +150,75 @@ class ARXResult:
                 The Java Arx result object.
         """
         self.arx_result = java_arx_result
+        self._quality_models: dict[str, JClass] = {}
+        self._attribute_values: dict[tuple[str, str], float] = {}
+        self._dataframes: dict[tuple[str, bool], pd.DataFrame] = {}
+
+    # The Java result does not change after anonymization, so each handle
+    # below is fetched across the JNI boundary only once.
+    @cached_property
+    def _output(self) -> JClass:
+        """
+        Returns the output DataHandle of the ARX result.
+        """
+        return self.arx_result.getOutput()
+
+    @cached_property
+    def _statistics(self) -> JClass:
+        """
+        Returns the statistics of the anonymized output.
+        """
+        return self._output.getStatistics()
+
+    @cached_property
+    def _quality_statistics(self) -> JClass:
+        """
+        Returns the quality statistics of the anonymized output.
+        """
+        return self._statistics.getQualityStatistics()
+
+    @cached_property
+    def _equivalence_class_statistics(self) -> _EquivalenceClassStatistics:
+        """
+        Returns the equivalence class statistics of the anonymized output.
+        """
+        return _EquivalenceClassStatistics(
+            self._statistics.getEquivalenceClassStatistics()
+        )
+
+    def _quality_model(self, name: str) -> JClass:
+        """
+        Returns a quality model of the output, fetched from ARX only once.
+
+        Args:
+            name (str): The model name, e.g. "Ambiguity" for getAmbiguity.
+
+        Returns:
+            JClass: The ARX quality model object.
+        """
+        model = self._quality_models.get(name)
+        if model is None:
+            model = getattr(self._quality_statistics, f"get{name}")()
+            self._quality_models[name] = model
+        return model
+
+    def _attribute_value(self, name: str, attribute: str) -> float:
+        """
+        Returns a per-attribute quality metric, read from ARX only once.
+
+        Args:
+            name (str): The model name, e.g. "Granularity" for getGranularity.
+            attribute (str): The attribute name.
+
+        Returns:
+            float: The metric value for the attribute.
+        """
+        key = (name, attribute)
+        value = self._attribute_values.get(key)
+        if value is None:
+            value = float(self._quality_model(name).getValue(attribute))
+            self._attribute_values[key] = value
+        return value
 
     @staticmethod
     def _data_handle_to_dataframe(data_handle: JClass) -> pd.DataFrame:
@@ -46,42 +232,211 @@ class ARXResult:
         Returns:
             pd.DataFrame: The dataset as a pandas DataFrame.
         """
-        column_names = [
-            str(data_handle.getAttributeName(i))
-            for i in range(data_handle.getNumColumns())
-        ]
+        # The row iterator yields the header first and then one String[] per
+        # record, so each row crosses the JNI boundary only once.
+        rows = data_handle.iterator()
+        column_names = [str(name) for name in rows.next()]
+        n_columns = len(column_names)
 
-        data = []
+        # Fills a preallocated matrix, so the frame is built without a copy.
+        data = np.empty((data_handle.getNumRows(), n_columns), dtype=object)
 
-        for i in range(data_handle.getNumRows()):
-            row = [
-                str(data_handle.getValue(i, j))
-                for j in range(data_handle.getNumColumns())
-            ]
-            data.append(row)
+        for i, values in enumerate(ARXResult._iter_values(rows, n_columns)):
+            data[i] = values
 
-        df = pd.DataFrame(data, columns=column_names)
+        df = pd.DataFrame(data, columns=column_names, copy=False)
         return df
 
-    def get_anonymized_data_as_dataframe(self) -> pd.DataFrame:
+    @staticmethod
+    def _iter_values(rows: JClass, n_columns: int) -> Iterator[list[str]]:
+        """
+        Converts the String[] rows of a DataHandle iterator to Python lists.
+
+        Args:
+            rows (jpype._jclass.java.util.Iterator):
+                The row iterator, already past the header.
+            n_columns (int): The number of columns in each row.
+
+        Yields:
+            list[str]: The values of the next row.
+        """
+        # Joins each row on the Java side, so only one string is converted.
+        join = _java_class("java.lang.String").join
+
+        for row in rows:
+            values = str(join(_ROW_SEPARATOR, row)).split(_ROW_SEPARATOR)
+            if len(values) != n_columns:
+                # A value contains the separator itself.
+                values = [str(value) for value in row]
+            yield values
+
+    @staticmethod
+    def _data_handle_to_dataframe_via_csv(data_handle: JClass) -> pd.DataFrame:
+        """
+        Converts a Java ARX DataHandle object to a pandas DataFrame through an
+        in-memory CSV buffer, written by ARX and parsed by the pandas C engine.
+
+        Args:
+            data_handle (jpype._jclass.org.deidentifier.arx.DataHandle):
+                The ARX DataHandle Object.
+
+        Returns:
+            pd.DataFrame: The dataset as a pandas DataFrame.
+        """
+        # The whole table crosses the bridge as a single byte[].
+        buffer = _java_class("java.io.ByteArrayOutputStream")()
+        data_handle.save(buffer, ",")
+        raw = bytes(buffer.toByteArray())
+
+        # Every value is kept as the exact string ARX holds.
+        return pd.read_csv(
+            io.BytesIO(raw),
+            engine="c",
+            dtype=str,
+            na_filter=False,
+            keep_default_na=False,
+        )
+
+    @staticmethod
+    def _to_dataframe(data_handle: JClass) -> pd.DataFrame:
+        """
+        Converts a Java ARX DataHandle object to a pandas DataFrame, choosing
+        the CSV route for large tables.
+
+        Args:
+            data_handle (jpype._jclass.org.deidentifier.arx.DataHandle):
+                The ARX DataHandle Object.
+
+        Returns:
+            pd.DataFrame: The dataset as a pandas DataFrame.
+        """
+        cells = data_handle.getNumRows() * data_handle.getNumColumns()
+        if cells > _CSV_THRESHOLD:
+            return ARXResult._data_handle_to_dataframe_via_csv(data_handle)
+        return ARXResult._data_handle_to_dataframe(data_handle)
+
+    @staticmethod
+    def _infer_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Converts the purely numeric columns of a string DataFrame in place.
+
+        Columns holding any non-numeric value, such as generalized ranges or
+        suppressed "*" cells, are left as strings.
+
+        Args:
+            df (pd.DataFrame): The DataFrame extracted from ARX.
+
+        Returns:
+            pd.DataFrame: The same DataFrame with numeric columns converted.
+        """
+        for column in df.columns:
+            try:
+                df[column] = pd.to_numeric(df[column])
+            except (ValueError, TypeError):
+                continue
+        return df
+
+    def _dataframe(self, handle: str, infer_dtypes: bool) -> pd.DataFrame:
+        """
+        Returns a copy of the input or output data, extracted only once.
+
+        Args:
+            handle (str): Either "input" or "output".
+            infer_dtypes (bool): Whether to convert numeric columns.
+
+        Returns:
+            pd.DataFrame: A copy the caller is free to modify.
+        """
+        key = (handle, infer_dtypes)
+        df = self._dataframes.get(key)
+        if df is None:
+            if handle == "output":
+                data_handle = self._output
+            else:
+                data_handle = self.arx_result.getInput()
+            df = ARXResult._to_dataframe(data_handle)
+            if infer_dtypes:
+                df = ARXResult._infer_dtypes(df)
+            self._dataframes[key] = df
+        return df.copy()
+
+    def get_anonymized_data_as_dataframe(
+        self, infer_dtypes: bool = True
+    ) -> pd.DataFrame:
         """
         Returns the anonymized dataset as a pandas DataFrame.
 
+        The table is extracted from ARX on the first call and copied on later
+        ones.
+
+        Args:
+            infer_dtypes (bool): Whether to convert numeric columns from the
+                strings ARX stores. Defaults to True.
+
         Returns:
             pd.Dataframe: Anonymized data.
         """
-        data_handle = self.arx_result.getOutput()
-        return ARXResult._data_handle_to_dataframe(data_handle)
+        return self._dataframe("output", infer_dtypes)
 
-    def get_raw_data_as_dataframe(self) -> pd.DataFrame:
+    def get_raw_data_as_dataframe(
+        self, infer_dtypes: bool = True
+    ) -> pd.DataFrame:
         """
         Returns the original (raw) dataset as a pandas DataFrame.
 
+        The table is extracted from ARX on the first call and copied on later
+        ones.
+
+        Args:
+            infer_dtypes (bool): Whether to convert numeric columns from the
+                strings ARX stores. Defaults to True.
+
         Returns:
             pd.DataFrame: Original data.
         """
-        data_handle = self.arx_result.getInput()
-        return ARXResult._data_handle_to_dataframe(data_handle)
+        return self._dataframe("input", infer_dtypes)
+
+    def get_anonymized_head(
+        self, n: int = 10, infer_dtypes: bool = True
+    ) -> pd.DataFrame:
+        """
+        Returns the first rows of the anonymized dataset.
+
+        Without dtype inference only those rows are read from ARX. Inferring
+        the dtypes needs every value of a column, e.g. a suppressed "*" far
+        down keeps it a string, so then the full table is extracted and the
+        rows match `get_anonymized_data_as_dataframe`.
+
+        Args:
+            n (int): The number of rows to return. Defaults to 10.
+            infer_dtypes (bool): Whether to convert numeric columns from the
+                strings ARX stores. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The first `n` anonymized records.
+        """
+        df = self._dataframes.get(("output", infer_dtypes))
+        if df is not None:
+            return df.iloc[:n].copy()
+        if infer_dtypes:
+            return self._dataframe("output", True).iloc[:n].copy()
+
+        rows = self._output.iterator()
+        column_names = [str(name) for name in rows.next()]
+        values = ARXResult._iter_values(rows, len(column_names))
+        return pd.DataFrame(list(islice(values, n)), columns=column_names)
+
+    def iter_rows(self) -> Iterator[list[str]]:
+        """
+        Streams the anonymized dataset row by row, without building a
+        DataFrame.
+
+        Yields:
+            list[str]: The values of each record, in column order.
+        """
+        rows = self._output.iterator()
+        n_columns = len(rows.next())
+        yield from ARXResult._iter_values(rows, n_columns)
 
     def get_transformations(self) -> dict[str, int]:
         """
@@ -90,19 +445,12 @@ class ARXResult:
         Returns:
             dict[str, int]: Mapping of quasi-identifier names to their generalization level.
         """
-        output_data = self.arx_result.getOutput()
-        quasi_identifiers = (
-            output_data.getDefinition()
-            .getQuasiIdentifyingAttributes()
-            .toArray()
-        )
-        transformations = {
-            quasi_identifier: self.arx_result.getOutput().getGeneralization(
-                quasi_identifier
-            )
-            for quasi_identifier in quasi_identifiers
-        }
-        return transformations
+        # The optimal node holds every level in one int[], in the same order
+        # as its quasi-identifiers, so two calls cover all attributes.
+        optimum = self.arx_result.getGlobalOptimum()
+        names = optimum.getQuasiIdentifyingAttributes()
+        levels = optimum.getTransformation()
+        return {str(name): int(level) for name, level in zip(names, levels)}
 
     def get_anonymization_time(self) -> int:
         """
@@ -111,17 +459,23 @@ class ARXResult:
         Returns:
             int: Time in milliseconds.
         """
-        return self.arx_result.getTime()
+        return int(self.arx_result.getTime())
 
-    def store_as_csv(self, output_path: str) -> None:
+    def store_as_csv(
+        self, output_path: str, chunksize: int | None = None
+    ) -> None:
         """
         Stores the anonymized dataset as CSV file.
 
+        ARX writes the file row by row itself, so memory stays bounded
+        without chunking.
+
         Args:
             output_path (str): File path to save the CSV.
+            chunksize (int | None): Accepted for parity with the other
+                backends and ignored.
         """
-        output = self.arx_result.getOutput()
-        output.save(output_path, ",")
+        self._output.save(output_path, ",")
 
     def get_average_equivalence_class_size(self) -> float:
         """
@@ -130,12 +484,7 @@ class ARXResult:
         Returns:
             float: Average equivalence class size.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getEquivalenceClassStatistics()
-            .getAverageEquivalenceClassSize()
-        )
+        return self._equivalence_class_statistics.average_size
 
     def get_number_of_suppressed_records(self) -> int:
         """
@@ -144,12 +493,7 @@ class ARXResult:
         Returns:
             int: Number of suppressed records.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getEquivalenceClassStatistics()
-            .getNumberOfSuppressedRecords()
-        )
+        return self._equivalence_class_statistics.suppressed_records
 
     def get_max_equivalence_class_size(self) -> int:
         """
@@ -158,12 +502,7 @@ class ARXResult:
         Returns:
             int: Maximum equivalence class size.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getEquivalenceClassStatistics()
-            .getMaximalEquivalenceClassSize()
-        )
+        return self._equivalence_class_statistics.max_size
 
     def get_min_equivalence_class_size(self) -> int:
         """
@@ -172,12 +511,7 @@ class ARXResult:
         Returns:
             int: Minimum equivalence class size.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getEquivalenceClassStatistics()
-            .getMinimalEquivalenceClassSize()
-        )
+        return self._equivalence_class_statistics.min_size
 
     def get_number_of_equivalence_classes(self) -> int:
         """
@@ -186,12 +520,7 @@ class ARXResult:
         Returns:
             int: Number of equivalence classes.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getEquivalenceClassStatistics()
-            .getNumberOfEquivalenceClasses()
-        )
+        return self._equivalence_class_statistics.count
 
     def get_discernability_metric(self) -> float:
         """
@@ -200,13 +529,8 @@ class ARXResult:
         Returns:
             float: discernability metric value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getDiscernibility()
-            .getValue()
-        )
+        model = self._quality_model("Discernibility")
+        return float(model.getValue())
 
     def get_average_class_size_metric(self) -> float:
         """
@@ -218,13 +542,8 @@ class ARXResult:
         Returns:
             float: Average class size metric value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getAverageClassSize()
-            .getValue()
-        )
+        model = self._quality_model("AverageClassSize")
+        return float(model.getValue())
 
     def get_granularity_metric(self, attribute: str) -> float:
         """
@@ -236,13 +555,7 @@ class ARXResult:
         Returns:
             float: Granularity metric value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getGranularity()
-            .getValue(attribute)
-        )
+        return self._attribute_value("Granularity", attribute)
 
     def get_ssesst_metric(self) -> float:
         """
@@ -251,13 +564,8 @@ class ARXResult:
         Returns:
             float: SSESST metric value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getSSESST()
-            .getValue()
-        )
+        model = self._quality_model("SSESST")
+        return float(model.getValue())
 
     def get_record_level_squared_error_metric(self) -> float:
         """
@@ -266,13 +574,8 @@ class ARXResult:
         Returns:
             float: Record-level squared error value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getRecordLevelSquaredError()
-            .getValue()
-        )
+        model = self._quality_model("RecordLevelSquaredError")
+        return float(model.getValue())
 
     def get_attribute_level_squared_error_metric(
         self, attribute: str
@@ -286,13 +589,7 @@ class ARXResult:
         Returns:
             float: Attribute-level squared error value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getAttributeLevelSquaredError()
-            .getValue(attribute)
-        )
+        return self._attribute_value("AttributeLevelSquaredError", attribute)
 
     def get_non_uniform_entropy_metric(self, attribute: str) -> float:
         """
@@ -304,13 +601,7 @@ class ARXResult:
         Returns:
             float: Non-uniform entropy value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getNonUniformEntropy()
-            .getValue(attribute)
-        )
+        return self._attribute_value("NonUniformEntropy", attribute)
 
     def get_generalization_intensity_metric(self, attribute: str) -> float:
         """
@@ -322,13 +613,7 @@ class ARXResult:
         Returns:
             float: Generalization intensity value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getGeneralizationIntensity()
-            .getValue(attribute)
-        )
+        return self._attribute_value("GeneralizationIntensity", attribute)
 
     def get_ambiguity_metric(self) -> float:
         """
@@ -337,15 +622,116 @@ class ARXResult:
         Returns:
             float: Ambiguity metric value.
         """
-        return (
-            self.arx_result.getOutput()
-            .getStatistics()
-            .getQualityStatistics()
-            .getAmbiguity()
-            .getValue()
+        model = self._quality_model("Ambiguity")
+        return float(model.getValue())
+
+    @cached_property
+    def _metrics(self) -> dict[str, float]:
+        """
+        Collects every dataset-level metric once, on first access.
+        """
+        return {
+            "average_equivalence_class_size": (
+                self.get_average_equivalence_class_size()
+            ),
+            "number_of_suppressed_records": (
+                self.get_number_of_suppressed_records()
+            ),
+            "max_equivalence_class_size": (
+                self.get_max_equivalence_class_size()
+            ),
+            "min_equivalence_class_size": (
+                self.get_min_equivalence_class_size()
+            ),
+            "number_of_equivalence_classes": (
+                self.get_number_of_equivalence_classes()
+            ),
+            "discernability": self.get_discernability_metric(),
+            "average_class_size": self.get_average_class_size_metric(),
+            "ssesst": self.get_ssesst_metric(),
+            "record_level_squared_error": (
+                self.get_record_level_squared_error_metric()
+            ),
+            "ambiguity": self.get_ambiguity_metric(),
+        }
+
+    def get_all_metrics(self) -> dict[str, float]:
+        """
+        Returns every dataset-level metric in a single dictionary.
+
+        The values are read from ARX once and reused by later calls, which
+        suits reports that need all of them. Per-attribute metrics are not
+        included.
+
+        Returns:
+            dict[str, float]: Mapping of metric names to their values.
+        """
+        return dict(self._metrics)
+
+    @cached_property
+    def _quasi_identifiers(self) -> tuple[str, ...]:
+        """
+        Returns the names of the quasi-identifiers in the output.
+        """
+        return tuple(
+            str(name)
+            for name in self._output.getDefinition()
+            .getQuasiIdentifyingAttributes()
+            .toArray()
         )
-    
 
+    def _attribute_metric(self, name: str) -> dict[str, float]:
+        """
+        Returns a per-attribute quality metric for every quasi-identifier.
+
+        Args:
+            name (str): The model name, e.g. "Granularity" for getGranularity.
+
+        Returns:
+            dict[str, float]: Mapping of quasi-identifiers to metric values.
+        """
+        return {
+            attribute: self._attribute_value(name, attribute)
+            for attribute in self._quasi_identifiers
+        }
+
+    def get_granularity_metrics(self) -> dict[str, float]:
+        """
+        Returns the granularity metric of every quasi-identifier.
+
+        Returns:
+            dict[str, float]: Mapping of quasi-identifiers to granularity.
+        """
+        return self._attribute_metric("Granularity")
+
+    def get_attribute_level_squared_error_metrics(self) -> dict[str, float]:
+        """
+        Returns the attribute-level squared error of every quasi-identifier.
+
+        Returns:
+            dict[str, float]:
+                Mapping of quasi-identifiers to attribute-level squared error.
+        """
+        return self._attribute_metric("AttributeLevelSquaredError")
+
+    def get_non_uniform_entropy_metrics(self) -> dict[str, float]:
+        """
+        Returns the non-uniform entropy of every quasi-identifier.
+
+        Returns:
+            dict[str, float]: Mapping of quasi-identifiers to entropy.
+        """
+        return self._attribute_metric("NonUniformEntropy")
+
+    def get_generalization_intensity_metrics(self) -> dict[str, float]:
+        """
+        Returns the generalization intensity of every quasi-identifier.
+
+        Returns:
+            dict[str, float]:
+                Mapping of quasi-identifiers to generalization intensity.
+        """
+        return self._attribute_metric("GeneralizationIntensity")
 
 
 class ARXAnonymizer:
@@ -354,20 +740,30 @@ class ARXAnonymizer:
     """
 
     @classmethod
-    def _load_arx_library(cls) -> None:
+    def _load_arx_library(cls, jvm_options: list[str] | None = None) -> None:
         """
         Loads the ARX Java library and starts the JVM if not already running.
 
+        Args:
+            jvm_options (list[str], optional): Extra JVM options, such as
+                heap sizes or GC flags. Ignored once the JVM is running.
+
         Raises:
             FileNotFoundError: If the ARX Jar file is not found.
         """
+        # The JVM lives for the whole process, so later calls return early.
+        if jpype.isJVMStarted():
+            return
+
         libarx = os.path.join(os.path.dirname(__file__), "libarx-3.9.2.jar")
 
         if not os.path.exists(libarx):
             raise FileNotFoundError(f"Could not locate libarx at {libarx}")
 
-        if not jpype.isJVMStarted():
-            jpype.startJVM(classpath=[libarx])
+        # Java strings stay Java objects until they are explicitly converted.
+        jpype.startJVM(
+            *(jvm_options or []), classpath=[libarx], convertStrings=False
+        )
 
     @classmethod
     def _define_attribute_types(
@@ -380,31 +776,27 @@ class ARXAnonymizer:
             data (JClass): The ARX Data object.
             config (AnonymizationConfig): The anonymization configuration.
         """
-        AttributeType = JClass("org.deidentifier.arx.AttributeType")
-
-        # Declares identifiers.
-        for identifier in config.identifiers:
-            data.getDefinition().setAttributeType(
-                identifier, AttributeType.IDENTIFYING_ATTRIBUTE
-            )
-
-        # Declares quasi-identifiers.
-        for quasi_identifier in config.quasi_identifiers:
-            data.getDefinition().setAttributeType(
-                quasi_identifier, AttributeType.QUASI_IDENTIFYING_ATTRIBUTE
-            )
-
-        # Declares sensitive attributes.
-        for sensitive_attribute in config.sensitive_attributes:
-            data.getDefinition().setAttributeType(
-                sensitive_attribute, AttributeType.SENSITIVE_ATTRIBUTE
-            )
+        AttributeType = _java_class("org.deidentifier.arx.AttributeType")
+        definition = data.getDefinition()
+
+        # Pairs every declared attribute with its ARX attribute type.
+        attribute_types = (
+            (config.identifiers, AttributeType.IDENTIFYING_ATTRIBUTE),
+            (
+                config.quasi_identifiers,
+                AttributeType.QUASI_IDENTIFYING_ATTRIBUTE,
+            ),
+            (config.sensitive_attributes, AttributeType.SENSITIVE_ATTRIBUTE),
+            (
+                config.insensitive_attributes,
+                AttributeType.INSENSITIVE_ATTRIBUTE,
+            ),
+        )
 
-        # Declares insensitive attributes.
-        for insensitive_attribute in config.insensitive_attributes:
-            data.getDefinition().setAttributeType(
-                insensitive_attribute, AttributeType.INSENSITIVE_ATTRIBUTE
-            )
+        # Declares all attributes in a single pass.
+        for attributes, attribute_type in attribute_types:
+            for attribute in attributes:
+                definition.setAttributeType(attribute, attribute_type)
 
     @classmethod
     def _define_hierarchies(
@@ -417,15 +809,13 @@ class ARXAnonymizer:
             data (JClass): The ARX Data Object.
             config (AnonymizationConfig): The anonymization configuration.
         """
-        Hierarchy = JClass("org.deidentifier.arx.AttributeType.Hierarchy")
-        CharSet = JClass("java.nio.charset.Charset")
+        definition = data.getDefinition()
 
-        # Defines all of the hierarchies.
+        # Defines all of the hierarchies, reusing the ones parsed before.
         for attribute, hierarchy_path in config.hierarchies.items():
-            hierarchy = Hierarchy.create(
-                hierarchy_path, CharSet.forName("UTF-8"), ","
-            )
-            data.getDefinition().setHierarchy(attribute, hierarchy)
+            path = os.path.realpath(hierarchy_path)
+            hierarchy = _load_hierarchy(path, os.stat(path).st_mtime_ns)
+            definition.setHierarchy(attribute, hierarchy)
 
     @classmethod
     def _create_arx_configuration(cls, config: AnonymizationConfig) -> JClass:
@@ -439,13 +829,15 @@ class ARXAnonymizer:
             JClass: The ARXConfiguration object ready for the anonymization.
         """
         # Important types.
-        KAnonymity = JClass("org.deidentifier.arx.criteria.KAnonymity")
-        LDiversity = JClass("org.deidentifier.arx.criteria.DistinctLDiversity")
-        TCloseness = JClass(
+        KAnonymity = _java_class("org.deidentifier.arx.criteria.KAnonymity")
+        LDiversity = _java_class(
+            "org.deidentifier.arx.criteria.DistinctLDiversity"
+        )
+        TCloseness = _java_class(
             "org.deidentifier.arx.criteria.EqualDistanceTCloseness"
         )
-        Metric = JClass("org.deidentifier.arx.metric.Metric")
-        ARXConfiguration = JClass("org.deidentifier.arx.ARXConfiguration")
+        Metric = _java_class("org.deidentifier.arx.metric.Metric")
+        ARXConfiguration = _java_class("org.deidentifier.arx.ARXConfiguration")
         configuration = ARXConfiguration.create()
         agg_func = Metric.AggregateFunction
 
@@ -489,12 +881,15 @@ class ARXAnonymizer:
                 "int": jpype.JInt,
                 "long": jpype.JLong,
                 "boolean": jpype.JBoolean,
-                "AggregateFunction": JClass("org.deidentifier.arx.metric.Metric$AggregateFunction")
+                "AggregateFunction": _java_class(
+                    "org.deidentifier.arx.metric.Metric$AggregateFunction"
+                ),
             }
 
-            # Gets the name and parameters.
+            # Gets the name and parameters, copied since the aggregate
+            # function is resolved in place and the config must not change.
             name = config.quality_metric.name
-            params = config.quality_metric.params
+            params = dict(config.quality_metric.params)
 
             # Resolves the metric constructor.
             create_metric = quality_metric_map.get(name)
@@ -585,9 +980,7 @@ class ARXAnonymizer:
             JClass:
                 The ARX Java result object containing the anonymized data and metrics.
         """
-        ARXAnonymizer = JClass("org.deidentifier.arx.ARXAnonymizer")
-        anonymizer = ARXAnonymizer()
-        return anonymizer.anonymize(data, configuration)
+        return _arx_anonymizer().anonymize(data, configuration)
 
     @staticmethod
     def _get_metric_signatures(doc: str) -> list[list[str]]:
@@ -646,7 +1039,7 @@ class ARXAnonymizer:
             "int": int,
             "long": int,
             "boolean": bool,
-            "AggregateFunction": JClass(
+            "AggregateFunction": _java_class(
                 "org.deidentifier.arx.metric.Metric$AggregateFunction"
             )
         }
@@ -671,6 +1064,32 @@ class ARXAnonymizer:
             
             
     
+    @classmethod
+    def _create_data(cls, config: AnonymizationConfig) -> JClass:
+        """
+        Creates the ARX Data object from the configured dataset.
+
+        A CSV path is parsed by ARX itself, while an in-memory DataFrame is
+        passed over as a single String[][] of its header and rows, with the
+        values formatted as they would read from a CSV file.
+
+        Args:
+            config (AnonymizationConfig): The anonymization configuration.
+
+        Returns:
+            JClass: The ARX Data object.
+        """
+        Data = _java_class("org.deidentifier.arx.Data")
+
+        if isinstance(config.data, str):
+            return Data.create(config.data, _utf8(), ",")
+
+        df = config.data
+        columns = [_csv_strings(df.iloc[:, i]) for i in range(df.shape[1])]
+        rows = [[str(column) for column in df.columns]]
+        rows.extend(map(list, zip(*columns)))
+        return Data.create(jpype.JArray(jpype.JString, 2)(rows))
+
     @classmethod
     def anonymize(cls, config: AnonymizationConfig) -> ARXResult:
         """
@@ -685,12 +1104,10 @@ class ARXAnonymizer:
         Returns:
             ARXResult: A wrapper for the ARX Java result object.
         """
-        ARXAnonymizer._load_arx_library()
-        Data = JClass("org.deidentifier.arx.Data")
-        CharSet = JClass("java.nio.charset.Charset")
+        ARXAnonymizer._load_arx_library(config.jvm_options)
 
         # Creates the data.
-        data = Data.create(config.data, CharSet.forName("UTF-8"), ",")
+        data = ARXAnonymizer._create_data(config)
 
         # Defines the attribute types.
         ARXAnonymizer._define_attribute_types(data, config)
@@ -10,7 +10,6 @@ from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
 
-import pandas as pd
 from loguru import logger
 
 from anonymization_manager import AnonymizationConfig, AnonymizationManager
@@ -22,17 +21,23 @@ class Arguments:
 
     config_path: str
     output_path: str
+    chunksize: int | None = None
 
 
 def _parse_arguments() -> tuple[Arguments, AnonymizationConfig]:
     """
     Parses the command-line arguments.
 
+    Arguments may also be read from a file passed as `@path`, one per line.
+    The --k, --l, --t and --suppression-limit flags override the values of the
+    configuration file.
+
     Returns:
         tuple[Arguments, AnonymizationConfig]: The parsed arguments and the provided config.
     """
     parser = argparse.ArgumentParser(
-        description="Anonymize datasets in various formats with k-anonymity, l-diversity and t-closeness"
+        description="Anonymize datasets in various formats with k-anonymity, l-diversity and t-closeness",
+        fromfile_prefix_chars="@",
     )
 
     parser.add_argument(
@@ -50,12 +55,41 @@ def _parse_arguments() -> tuple[Arguments, AnonymizationConfig]:
         help="Relative path to save the resulting anonymized dataset",
     )
 
+    parser.add_argument(
+        "--chunksize",
+        required=False,
+        type=int,
+        help="Number of rows written at a time when storing the CSV",
+    )
+
+    # These override the values in the configuration file.
+    parser.add_argument("--k", type=int, help="Override the k value")
+    parser.add_argument("--l", type=int, help="Override the l value")
+    parser.add_argument("--t", type=float, help="Override the t value")
+    parser.add_argument(
+        "--suppression-limit",
+        type=float,
+        help="Override the suppression limit",
+    )
+
     args = parser.parse_args()
 
     config = AnonymizationConfig.from_json(args.config)
 
+    overrides = {
+        name: getattr(args, name)
+        for name in ("k", "l", "t", "suppression_limit")
+        if getattr(args, name) is not None
+    }
+    if overrides:
+        config = config.replace(**overrides)
+
     return (
-        Arguments(config_path=args.config, output_path=args.output),
+        Arguments(
+            config_path=args.config,
+            output_path=args.output,
+            chunksize=args.chunksize,
+        ),
         config,
     )
 
@@ -84,16 +118,15 @@ def _generate_path(config) -> str:
     dataset = Path(config.data).stem
     parts = [f"{dataset}_k-{config.k}"]
 
-    if hasattr(config, "l") and config.l is not None:
-        parts.append(f"l-{config.l}")
-    if hasattr(config, "t") and config.t is not None:
-        parts.append(f"t-{config.t}")
-
-    results_dir = Path("results")
-    results_dir.mkdir(parents=True, exist_ok=True)
+    l = getattr(config, "l", None)
+    if l is not None:
+        parts.append(f"l-{l}")
+    t = getattr(config, "t", None)
+    if t is not None:
+        parts.append(f"t-{t}")
 
     filename = "_".join(parts) + ".csv"
-    return str(results_dir / filename)
+    return str(Path("results") / filename)
 
 
 def main():
@@ -110,14 +143,16 @@ def main():
 
     if not path:
         path = _generate_path(config)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
 
-    data.store_as_csv(path)
-    logger.info(f"Anonymized data stored in {path}")
-
+    # Only the previewed rows are materialized, as strings, before the full
+    # write.
     entries_num = 10
     logger.info(f"Top {entries_num} entries:")
-    anon_data: pd.DataFrame = data.get_anonymized_data_as_dataframe()
-    print(anon_data.head(n=entries_num))
+    print(data.get_anonymized_head(entries_num, infer_dtypes=False))
+
+    data.store_as_csv(path, chunksize=args.chunksize)
+    logger.info(f"Anonymized data stored in {path}")
 
     trans = data.get_transformations()
     logger.info("Transformations applied:")
@@ -1,15 +1,32 @@
-import json
 import os
+from collections.abc import Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Annotated, Any, Dict, List, Literal, Optional
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 from pydantic import (
+    AfterValidator,
     BaseModel,
+    ConfigDict,
     Field,
+    PlainSerializer,
+    ValidationError,
     field_validator,
     model_validator,
 )
+from pydantic_core import PydanticCustomError
 
 MetricType = Literal["loss", 
                      "aecs", 
@@ -28,6 +45,100 @@ MetricType = Literal["loss",
 
 BackendType = Literal["arx", "anjana"]
 
+
+class FrozenDict(dict):
+    """
+    A dict that cannot be changed once built.
+
+    Unlike `types.MappingProxyType` it can be pickled and deep-copied, so
+    configurations can still be sent to worker processes.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (dict(self),))
+
+
+# A dict that is stored read-only once validated and dumped as a plain dict.
+FrozenStrDict = Annotated[
+    Dict[str, str], AfterValidator(FrozenDict), PlainSerializer(dict)
+]
+FrozenWeightDict = Annotated[
+    Dict[str, Annotated[float, Field(ge=0)]],
+    AfterValidator(FrozenDict),
+    PlainSerializer(dict),
+]
+FrozenParamDict = Annotated[
+    Dict[str, Any], AfterValidator(FrozenDict), PlainSerializer(dict)
+]
+
+# The attribute lists whose names must not overlap.
+_ATTR_FIELDS = (
+    "identifiers",
+    "quasi_identifiers",
+    "sensitive_attributes",
+    "insensitive_attributes",
+)
+
+_SKIP_FS_CHECKS: ContextVar[bool] = ContextVar("skip_fs_checks", default=False)
+
+
+@contextmanager
+def config_context(*, skip_fs_checks: bool = False) -> Iterator[None]:
+    """
+    Temporarily changes how configurations are validated.
+
+    Args:
+        skip_fs_checks (bool): Whether to skip the checks that the dataset and
+            hierarchy files exist. Meant for batches of configs built from a
+            known-good directory; `AnonymizationConfig.validate_files` runs
+            the checks on demand.
+    """
+    token = _SKIP_FS_CHECKS.set(skip_fs_checks)
+    try:
+        yield
+    finally:
+        _SKIP_FS_CHECKS.reset(token)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Converts a field value to a hashable equivalent.
+    """
+    if isinstance(value, BaseModel):
+        value = dict(value)
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(v)) for key, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, pd.DataFrame):
+        return id(value)
+    return value
+
+
+def _missing_dataset(path: str) -> Optional[str]:
+    """
+    Returns the error message if the dataset file does not exist.
+    """
+    if not os.path.exists(path):
+        return f"The dataset could not be located at {path!r}!"
+    return None
+
+
+def _missing_hierarchy(qid: str, path: str) -> Optional[str]:
+    """
+    Returns the error message if the hierarchy file does not exist.
+    """
+    if not os.path.exists(path):
+        return f"Cannot create hierarchy for {qid!r}, the path {path!r} could not be located!"
+    return None
+
+
 class MetricConfig(BaseModel):
     """
         Configuration object for the quality metric.
@@ -37,19 +148,26 @@ class MetricConfig(BaseModel):
                 The name of the quality metric.
             
             params (dict[str, any]):
-                A dictionary mapping the parameters to values.
+                A dictionary mapping the parameters to values, stored
+                read-only.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: MetricType
-    params: Dict[str, Any] = Field(default_factory=dict)
+    params: FrozenParamDict = Field(
+        default_factory=dict, validate_default=True
+    )
 
 class AnonymizationConfig(BaseModel):
     """
     Configuration object for the anonymization workflow.
 
     Attributes:
-        data (str):
+        data (str | pd.DataFrame):
             Path to the input dataset. Supported formats include CSV, Excel,
-            JSON, and SQLite (.db) files.
+            JSON, and SQLite (.db) files. A DataFrame already in memory can
+            be passed instead, which is handed to the backend without
+            reading a file.
 
         identifiers (list[str], optional):
             List of direct identifiers (e.g., name, SSN, phone number).
@@ -92,32 +210,156 @@ class AnonymizationConfig(BaseModel):
             more information, check the documentation.
         attribute_weights (dict[str, float], optional):
             A set assigning weight "importance" to each attribute.
+
+        jvm_options (list[str], optional):
+            Extra options for the JVM that runs ARX, e.g. ["-Xmx4g",
+            "-XX:+UseParallelGC"]. They only apply when the JVM is started,
+            i.e. on the first ARX anonymization of the process.
+
+    Configurations are frozen once validated and hashable, so they can key
+    the caches of the adapters. The attribute lists are stored as tuples and
+    the dicts as read-only mappings, so a hashed value cannot change. An
+    in-memory dataset is hashed and compared by identity.
     """
-    data: str
-    identifiers: Optional[List[str]] = Field(default_factory=list)
-    quasi_identifiers: Optional[List[str]] = Field(default_factory=list)
-    sensitive_attributes: Optional[List[str]] = Field(default_factory=list)
-    insensitive_attributes: Optional[List[str]] = Field(default_factory=list)
-    hierarchies: Optional[Dict[str, str]] = Field(default_factory=dict)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    data: Union[str, pd.DataFrame]
+    identifiers: Optional[Tuple[str, ...]] = ()
+    quasi_identifiers: Optional[Tuple[str, ...]] = ()
+    sensitive_attributes: Optional[Tuple[str, ...]] = ()
+    insensitive_attributes: Optional[Tuple[str, ...]] = ()
+    hierarchies: Optional[FrozenStrDict] = Field(
+        default_factory=dict, validate_default=True
+    )
     k: Optional[int] = Field(None, gt=0, description="k must be an integer > 0!")
     l: Optional[int] = Field(None, gt=0, description="l must be an integer > 0!")
     t: Optional[float] = Field(None, ge=0.0, le=1.0, description="t must be a float in [0,1]!")
     quality_metric: Optional[MetricConfig] = Field(None)
     suppression_limit: Optional[float] = Field(None, ge=0.0, le=1.0)
     backend: Optional[BackendType] = "arx"
-    attribute_weights: Optional[Dict[str, Annotated[float, Field(ge=0)]]] = None
+    attribute_weights: Optional[FrozenWeightDict] = None
+    jvm_options: Optional[Tuple[str, ...]] = ()
+
+    def _key(self) -> tuple:
+        """
+        Returns the hashable equivalent of the field values.
+
+        The key is not cached on the instance, since `model_copy(update=...)`
+        and pickling carry the instance dict over to a config whose values or
+        hash seed differ.
+        """
+        values = (getattr(self, name) for name in type(self).model_fields)
+        return tuple(_freeze(value) for value in values)
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the field values, with in-memory datasets compared by
+        identity instead of element-wise.
+        """
+        if not isinstance(other, AnonymizationConfig):
+            return NotImplemented
+        return type(self) is type(other) and self._key() == other._key()
 
     @classmethod
     def from_json(cls, json_path: str):
-        with open(json_path, "r") as file:
-            config_json = json.load(file)
-
-        attributes = {
-            key: config_json[key]
-            for key in cls.__annotations__
-            if key in config_json
-        }
-        return cls(**attributes)
+        """
+        Loads the configuration from a JSON file.
+
+        The file is parsed and validated in a single pass by pydantic's JSON
+        parser. Keys that are not configuration fields are ignored. Loading
+        an unchanged file again returns a copy of the cached configuration,
+        after checking again that its dataset and hierarchy files exist.
+        """
+        path = os.path.abspath(json_path)
+        stat = os.stat(path)
+        skip_fs_checks = _SKIP_FS_CHECKS.get()
+        config = _load_json_config(
+            cls, path, stat.st_mtime_ns, stat.st_size, skip_fs_checks
+        )
+        # --- A cached config was validated earlier, when the files existed.
+        if not skip_fs_checks:
+            config.validate_files()
+        return config.model_copy()
+
+    def replace(self, **changes: Any) -> "AnonymizationConfig":
+        """
+        Returns a copy of the configuration with the given fields changed.
+
+        Unlike `model_copy(update=...)`, the result is validated again, so
+        the changed values obey the same constraints as the original ones.
+        Unchanged values, including an in-memory dataset, are shared.
+        """
+        return type(self).model_validate({**dict(self), **changes})
+
+    def validate_files(self) -> None:
+        """
+        Checks that the dataset and every hierarchy file exist.
+
+        These checks run on construction unless they were skipped with
+        `config_context(skip_fs_checks=True)`.
+
+        Raises:
+            FileNotFoundError: If the dataset or a hierarchy file cannot be
+                located.
+        """
+        missing = self._missing_files()
+        if missing:
+            raise FileNotFoundError(missing[0][1])
+
+    def _missing_files(self) -> list[tuple[str, str]]:
+        """
+        Returns the field path and error message of every missing file.
+        """
+        missing = []
+        if not isinstance(self.data, pd.DataFrame):
+            message = _missing_dataset(self.data)
+            if message:
+                missing.append(("data", message))
+        for qid, hierarchy_path in self.hierarchies.items():
+            message = _missing_hierarchy(qid, hierarchy_path)
+            if message:
+                missing.append((f"hierarchies.{qid}", message))
+        return missing
+
+    @classmethod
+    def check_json(cls, json_path: str) -> list[dict[str, str]]:
+        """
+        Lists the problems of a JSON configuration file without raising.
+
+        Every problem is reported, including all missing files, as a dict
+        with a machine-readable "code", the dotted "path" of the field and a
+        "message". An empty list means `from_json` would succeed.
+        """
+        with open(json_path, "rb") as file:
+            raw = file.read()
+
+        try:
+            with config_context(skip_fs_checks=True):
+                config = cls.model_validate_json(raw)
+        except ValidationError as error:
+            return [
+                {
+                    "code": detail["type"],
+                    "path": ".".join(map(str, detail["loc"])),
+                    "message": detail["msg"],
+                }
+                for detail in error.errors()
+            ]
+
+        return [
+            {"code": "file_not_found", "path": path, "message": message}
+            for path, message in config._missing_files()
+        ]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Drops every configuration cached by `from_json`.
+        """
+        _load_json_config.cache_clear()
     
     @model_validator(mode="after")
     def validate_attributes(self) -> "AnonymizationConfig":
@@ -131,40 +373,46 @@ class AnonymizationConfig(BaseModel):
         Raises:
             ValueError: If attribute names overlap across categories.
         """
-        attr_list = {
-            "identifiers": self.identifiers,
-            "quasi_identifiers": self.quasi_identifiers,
-            "sensitive_attributes": self.sensitive_attributes,
-            "insensitive_attributes": self.insensitive_attributes,
-        }
-        # --- Checks that the attribute names do not overlap.
-        all_attrs = sum(attr_list.values(), [])
-        if len(all_attrs) != len(set(all_attrs)):
-            raise ValueError(
-                f"Attribute names must be unique across all types!"
-            )
+        # --- Checks that the attribute names do not overlap, in one pass.
+        seen = set()
+        for name in _ATTR_FIELDS:
+            for attr in getattr(self, name) or ():
+                if attr in seen:
+                    raise PydanticCustomError(
+                        "duplicate_attribute",
+                        "Attribute names must be unique across all types!, "
+                        "'{attribute}' is declared more than once.",
+                        {"attribute": attr},
+                    )
+                seen.add(attr)
         
         return self
 
     @field_validator("data")
     @classmethod
-    def validate_dataset(cls, path: str) -> str:
+    def validate_dataset(
+        cls, path: Union[str, pd.DataFrame]
+    ) -> Union[str, pd.DataFrame]:
         """
         Validates the dataset path.
 
         Checks:
-            - Dataset path is a string
+            - Dataset path is a string or a DataFrame
             - Dataset file exists at the given path
 
         Raises:
             TypeError: If the dataset path is not a string.
             FileNotFoundError: If the file does not exist at the given path.
         """
+        # --- In-memory datasets have no file to check.
+        if isinstance(path, pd.DataFrame):
+            return path
+
         # --- Checks that the dataset file exists.
-        if not os.path.exists(path):
-            raise FileNotFoundError(
-                f"The dataset could not be located at {path!r}!"
-            )
+        if not _SKIP_FS_CHECKS.get():
+            message = _missing_dataset(path)
+            if message:
+                raise FileNotFoundError(message)
         return path
     
     @model_validator(mode="after")
@@ -180,20 +428,26 @@ class AnonymizationConfig(BaseModel):
             ValueError: If a key is not a quasi-identifier.
             FileNotFoundError: If any hierarchy file cannot be located at the given path.
         """
+        # --- Hashes the quasi-identifiers once for the membership checks.
+        qid_set = frozenset(self.quasi_identifiers or ())
+        check_files = not _SKIP_FS_CHECKS.get()
+
         # --- Checks if the hierarchies are valid ---
         for qid, hierarchy_path in self.hierarchies.items():
             # --- Checks that the quasi-identifier exists ---
-            if qid not in self.quasi_identifiers:
-                raise ValueError(
-                    f"Cannot create hierarchy for {qid!r}, since it is not a quasi-identifier!"
+            if qid not in qid_set:
+                raise PydanticCustomError(
+                    "hierarchy_not_quasi_identifier",
+                    "Cannot create hierarchy for '{attribute}', since it is not a quasi-identifier!",
+                    {"attribute": qid},
                 )
 
             # --- Checks that the hierarchy path exists.
-            if not os.path.exists(hierarchy_path):
-                raise FileNotFoundError(
-                    f"Cannot create hierarchy for {qid!r}, the path {hierarchy_path!r} could not be located!"
-                )
-            
+            if check_files:
+                message = _missing_hierarchy(qid, hierarchy_path)
+                if message:
+                    raise FileNotFoundError(message)
+
         return self
 
     @model_validator(mode="after")
@@ -208,8 +462,10 @@ class AnonymizationConfig(BaseModel):
             ValueError: If sensitive attributes exist but neither 'l' nor 't' is provided.
         """
         if self.sensitive_attributes and self.t is None and self.l is None:
-            raise ValueError(
-                f"sensitive-attributes={self.sensitive_attributes}, l-Diversity or t-Closeness must be used when anonymizing with sensitive attributes!"
+            raise PydanticCustomError(
+                "privacy_model_missing",
+                "sensitive-attributes={sensitive_attributes}, l-Diversity or t-Closeness must be used when anonymizing with sensitive attributes!",
+                {"sensitive_attributes": self.sensitive_attributes},
             )
         
         return self
@@ -225,8 +481,29 @@ class AnonymizationConfig(BaseModel):
                 ValueError: If anjana is used with the quality metric parameter.
         """
         if self.backend == "anjana" and self.quality_metric is not None:
-            raise ValueError(
-                "Anjana does not support quality metric as a parameter!"
+            raise PydanticCustomError(
+                "quality_metric_unsupported",
+                "Anjana does not support quality metric as a parameter!",
             )
         
-        return self
\ No newline at end of file
+        return self
+
+
+@lru_cache(maxsize=128)
+def _load_json_config(
+    cls: type[AnonymizationConfig],
+    json_path: str,
+    mtime_ns: int,
+    size: int,
+    skip_fs_checks: bool,
+) -> AnonymizationConfig:
+    """
+    Parses and validates a JSON configuration file.
+
+    The modification time and size are part of the cache key, so an edited
+    file is loaded again instead of being served stale. So is the
+    `skip_fs_checks` flag, so a config loaded without the file checks is
+    never served to a caller that expects them.
+    """
+    with open(json_path, "rb") as file:
+        return cls.model_validate_json(file.read())
@@ -3,26 +3,71 @@ The public-facing API of the Anonymization Manager component, part of the open
 source RECITALS platform.
 """
 
-import json
+import importlib
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from loguru import logger
 
-from anonymization_manager.adapters.anjana.anjana import (
-    AnjanaAnonymizer,
-    AnjanaResult,
-)
-from anonymization_manager.adapters.arx.arx import ARXAnonymizer, ARXResult
 from anonymization_manager.config import AnonymizationConfig
 
+if TYPE_CHECKING:
+    from anonymization_manager.adapters.anjana.anjana import (
+        AnjanaAnonymizer,
+        AnjanaResult,
+    )
+    from anonymization_manager.adapters.arx.arx import (
+        ARXAnonymizer,
+        ARXResult,
+    )
+
+# The adapters are imported on first use, so a process only pays for the
+# backend it runs (importing ANJANA alone takes tens of milliseconds).
+_ADAPTER_MODULES = {
+    "ARXAnonymizer": "anonymization_manager.adapters.arx.arx",
+    "ARXResult": "anonymization_manager.adapters.arx.arx",
+    "AnjanaAnonymizer": "anonymization_manager.adapters.anjana.anjana",
+    "AnjanaResult": "anonymization_manager.adapters.anjana.anjana",
+}
+_adapters: dict[str, Any] = {}
+
+# Maps every BackendType to the name of its anonymizer class.
+_BACKENDS = {
+    "arx": "ARXAnonymizer",
+    "anjana": "AnjanaAnonymizer",
+}
+
+
+def _load_adapter(name: str) -> Any:
+    """
+    Imports an adapter class on first use and caches it.
+    """
+    adapter = _adapters.get(name)
+    if adapter is None:
+        module = importlib.import_module(_ADAPTER_MODULES[name])
+        adapter = _adapters[name] = getattr(module, name)
+    return adapter
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Keeps the adapter classes importable from this module.
+    """
+    if name in _ADAPTER_MODULES:
+        return _load_adapter(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class AnonymizedData:
     """
     This is a wrapper class for ARXResult, AnjanaResult.
     """
 
-    def __init__(self, result: ARXResult | AnjanaResult):
+    def __init__(self, result: "ARXResult | AnjanaResult"):
         self._result = result
+        # Binds the public methods once, so calls skip __getattr__.
+        for name, attr in vars(type(result)).items():
+            if not name.startswith("_") and callable(attr):
+                setattr(self, name, getattr(result, name))
 
     def __getattr__(self, name):
         return getattr(self._result, name)
@@ -33,11 +78,20 @@ class AnonymizationManager:
     This is the class representing the anonymization manager.
     """
 
+    @staticmethod
     def anonymize(config: AnonymizationConfig) -> AnonymizedData:
-        if config.backend == None or config.backend == "arx":
-            return AnonymizedData(ARXAnonymizer.anonymize(config))
-        elif config.backend == "anjana":
-            return AnonymizedData(AnjanaAnonymizer.anonymize(config))
-        else:
+        """
+        Anonymizes the dataset with the backend selected in the config.
+
+        The anonymizer of each backend is imported and resolved once, so
+        repeated calls only look it up.
+
+        Returns:
+            AnonymizedData: The wrapped result of the backend.
+        """
+        name = _BACKENDS.get(config.backend or "arx")
+        if name is None:
             logger.warning(f"Unsupported backend: {config.backend}, using ARX")
-            return AnonymizedData(ARXAnonymizer.anonymize(config))
+            name = _BACKENDS["arx"]
+        anonymizer = _load_adapter(name)
+        return AnonymizedData(anonymizer.anonymize(config))
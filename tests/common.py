@@ -1,6 +1,8 @@
 import contextlib
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 from pydantic import ValidationError
 
@@ -9,11 +11,74 @@ from anonymization_manager import *
 TEST_DIR = Path(__file__).parent
 PATH = str(TEST_DIR / "test_dataset/data/adult.csv")
 HIERARCHY_PATH = TEST_DIR / "test_dataset/hierarchies"
-AGE_PATH = str(HIERARCHY_PATH / "age.csv")
-COUNTRY_PATH = str(HIERARCHY_PATH / "country.csv")
-RACE_PATH = str(HIERARCHY_PATH / "race.csv")
-SEX_PATH = str(HIERARCHY_PATH / "sex.csv")
-MARITAL_PATH = str(HIERARCHY_PATH / "marital.csv")
-OCCUPATION_PATH = str(HIERARCHY_PATH / "occupation.csv")
-WORK_CLASS_PATH = str(HIERARCHY_PATH / "workclass.csv")
-EDUCATION_PATH = str(HIERARCHY_PATH / "education.csv")
+# The hierarchy of every quasi-identifier of adult.csv, by column name.
+HIERARCHIES = {
+    column: str(HIERARCHY_PATH / f"{name}.csv")
+    for column, name in (
+        ("age", "age"),
+        ("native-country", "country"),
+        ("race", "race"),
+        ("sex", "sex"),
+        ("marital-status", "marital"),
+        ("occupation", "occupation"),
+        ("workclass", "workclass"),
+        ("education", "education"),
+    )
+}
+AGE_PATH = HIERARCHIES["age"]
+COUNTRY_PATH = HIERARCHIES["native-country"]
+RACE_PATH = HIERARCHIES["race"]
+SEX_PATH = HIERARCHIES["sex"]
+MARITAL_PATH = HIERARCHIES["marital-status"]
+OCCUPATION_PATH = HIERARCHIES["occupation"]
+WORK_CLASS_PATH = HIERARCHIES["workclass"]
+EDUCATION_PATH = HIERARCHIES["education"]
+
+
+def param_id(value) -> str:
+    """Names a parametrize value readably, with test paths made relative."""
+    if isinstance(value, type):
+        return value.__name__
+    if isinstance(value, pd.DataFrame):
+        return "DataFrame"
+    return repr(value).replace(f"{TEST_DIR}/", "")
+
+
+# nullcontext keeps no state, so one instance serves every case.
+_NO_ERROR = contextlib.nullcontext()
+
+
+def expect_error(error: type[Exception] | None):
+    """Expects `error` to be raised, or nothing at all when it is None."""
+    return pytest.raises(error) if error else _NO_ERROR
+
+
+def group_classes(
+    df: pd.DataFrame, columns: list[str]
+) -> pd.api.typing.DataFrameGroupBy:
+    """Groups the rows into their equivalence classes, in any order."""
+    return df.groupby(list(columns), sort=False, observed=True)
+
+
+def group_sizes(df: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """Returns the size of every equivalence class, in no particular order."""
+    return group_classes(df, columns).size().to_numpy()
+
+
+@pytest.fixture(scope="session")
+def adult_df() -> pd.DataFrame:
+    """The adult dataset, read once per test session."""
+    return pd.read_csv(PATH, skipinitialspace=True)
+
+
+@pytest.fixture
+def require_backend(backend: str) -> None:
+    """Skips the test when its backend cannot run here."""
+    module = pytest.importorskip({"arx": "jpype", "anjana": "anjana"}[backend])
+
+    # JPype imports without a JVM, which ARX needs as well.
+    if backend == "arx":
+        try:
+            module.getDefaultJVMPath()
+        except module.JVMNotFoundException as error:
+            pytest.skip(f"no JVM found: {error}")
@@ -3,40 +3,139 @@ from tests.common import *
 
 class TestKAnonymity:
     @pytest.mark.parametrize("k", [(1), (10), (40)])
-    def test_k_anonymity(self, k) -> None:
-        for backend in ["arx", "anjana"]:
-            config = AnonymizationConfig(
-                data=PATH,
-                identifiers=["education-num"],
-                quasi_identifiers=[
-                    "age",
-                    "native-country",
-                    "race",
-                    "sex",
-                    "marital-status",
-                    "occupation",
-                    "workclass",
-                    "education",
-                ],
-                sensitive_attributes=[],
-                insensitive_attributes=[],
-                hierarchies={
-                    "age": AGE_PATH,
-                    "native-country": COUNTRY_PATH,
-                    "race": RACE_PATH,
-                    "sex": SEX_PATH,
-                    "marital-status": MARITAL_PATH,
-                    "occupation": OCCUPATION_PATH,
-                    "workclass": WORK_CLASS_PATH,
-                    "education": EDUCATION_PATH,
-                },
-                k=k,
-                backend=backend,
-            )
-
-            data = AnonymizationManager.anonymize(config)
-            df = data.get_anonymized_data_as_dataframe()
-
-            # Checks k-anonymity.
-            group_sizes = df.groupby(config.quasi_identifiers).size()
-            assert (group_sizes >= k).all()
+    @pytest.mark.parametrize("backend", ["arx", "anjana"])
+    def test_k_anonymity(self, k, backend, require_backend) -> None:
+        config = AnonymizationConfig(
+            data=PATH,
+            identifiers=["education-num"],
+            quasi_identifiers=[
+                "age",
+                "native-country",
+                "race",
+                "sex",
+                "marital-status",
+                "occupation",
+                "workclass",
+                "education",
+            ],
+            sensitive_attributes=[],
+            insensitive_attributes=[],
+            hierarchies=HIERARCHIES,
+            k=k,
+            backend=backend,
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        df = data.get_anonymized_data_as_dataframe()
+
+        # Checks k-anonymity.
+        sizes = group_sizes(df, config.quasi_identifiers)
+        assert (sizes >= k).all()
+
+    @pytest.mark.parametrize("backend", ["arx", "anjana"])
+    def test_k_anonymity_from_dataframe(self, adult_df, backend, require_backend) -> None:
+        config = AnonymizationConfig(
+            data=adult_df,
+            identifiers=["education-num"],
+            quasi_identifiers=["age", "race", "sex"],
+            hierarchies={
+                "age": AGE_PATH,
+                "race": RACE_PATH,
+                "sex": SEX_PATH,
+            },
+            k=10,
+            backend=backend,
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        df = data.get_anonymized_data_as_dataframe()
+
+        # Checks k-anonymity.
+        sizes = group_sizes(df, config.quasi_identifiers)
+        assert (sizes >= 10).all()
+
+    @pytest.mark.parametrize("backend", ["arx"])
+    def test_k_anonymity_from_dataframe_with_missing_age(
+        self, adult_df, tmp_path, backend, require_backend
+    ) -> None:
+        # A missing age turns the column into floats, e.g. 39.0.
+        df = adult_df.copy()
+        df.loc[0, "age"] = np.nan
+
+        # Missing values reach ARX as empty strings, like in a CSV file.
+        hierarchy_path = tmp_path / "age.csv"
+        hierarchy_path.write_text(
+            Path(AGE_PATH).read_text().rstrip("\n") + "\n,*,*,*,*,*,*\n"
+        )
+
+        config = AnonymizationConfig(
+            data=df,
+            quasi_identifiers=["age", "race", "sex"],
+            hierarchies={
+                "age": str(hierarchy_path),
+                "race": RACE_PATH,
+                "sex": SEX_PATH,
+            },
+            k=10,
+            backend=backend,
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        df = data.get_anonymized_data_as_dataframe()
+
+        # Checks k-anonymity.
+        sizes = group_sizes(df, config.quasi_identifiers)
+        assert (sizes >= 10).all()
+
+    @pytest.mark.parametrize("backend", ["arx", "anjana"])
+    def test_iter_rows(self, backend, require_backend) -> None:
+        config = AnonymizationConfig(
+            data=PATH,
+            identifiers=["education-num"],
+            quasi_identifiers=["age", "race", "sex"],
+            hierarchies={
+                "age": AGE_PATH,
+                "race": RACE_PATH,
+                "sex": SEX_PATH,
+            },
+            k=10,
+            backend=backend,
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        df = data.get_anonymized_data_as_dataframe()
+
+        # Checks that streaming yields the same records as the DataFrame.
+        rows = list(data.iter_rows())
+        assert len(rows) == len(df)
+        assert [str(v) for v in rows[0]] == [str(v) for v in df.iloc[0]]
+
+    @pytest.mark.parametrize("backend", ["arx", "anjana"])
+    def test_anonymized_head(self, backend, require_backend) -> None:
+        config = AnonymizationConfig(
+            data=PATH,
+            identifiers=["education-num"],
+            quasi_identifiers=["age", "race", "sex"],
+            hierarchies={
+                "age": AGE_PATH,
+                "race": RACE_PATH,
+                "sex": SEX_PATH,
+            },
+            k=10,
+            backend=backend,
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        head = data.get_anonymized_head(5)
+        df = data.get_anonymized_data_as_dataframe()
+
+        assert len(head) == 5
+        assert head.equals(df.head(5))
+        assert (head.dtypes == df.dtypes).all()
+
+        # The head is a copy, so changing it leaves the result untouched.
+        head.iloc[0, 0] = "changed"
+        assert data.get_anonymized_head(1).iloc[0, 0] == df.iloc[0, 0]
+
+        strings = data.get_anonymized_head(5, infer_dtypes=False)
+        assert strings.astype(str).equals(df.head(5).astype(str))
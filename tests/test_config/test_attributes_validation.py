@@ -18,9 +18,10 @@ class TestAttributes:
             ),
             ([1], ValidationError),  # Integer Identifier
         ],
+        ids=param_id,
     )
     def test_identifier_values(self, identifiers, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(data=PATH, 
                                          identifiers=identifiers
                                          )
@@ -41,9 +42,10 @@ class TestAttributes:
             ),
             ([1], ValidationError),  # Integer
         ],
+        ids=param_id,
     )
     def test_quasi_identifier_values(self, qidentifiers, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(data=PATH, 
                                          quasi_identifiers=qidentifiers
                                          )
@@ -63,9 +65,10 @@ class TestAttributes:
             ),
             ([1], ValidationError),  # Integer Sensitive
         ],
+        ids=param_id,
     )
     def test_sensitive_values(self, sensitives, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(data=PATH, 
                                          sensitive_attributes=sensitives,
                                          l=2)
@@ -85,9 +88,10 @@ class TestAttributes:
             ),
             ([1], ValidationError),  # Integer Insensitive
         ],
+        ids=param_id,
     )
     def test_insensitive_values(self, insensitives, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(data=PATH, 
                                          insensitive_attributes=insensitives, 
                                          )
@@ -1,3 +1,5 @@
+import pandas as pd
+
 from tests.common import *
 
 
@@ -6,10 +8,63 @@ class TestDataset:
         "dataset,error",
         [
             (PATH, None),  # Exists.
+            (pd.read_csv(PATH), None),  # In-memory DataFrame.
             ("dummy", FileNotFoundError),  # Does Not Exists.
             (123, ValidationError),  # Integer
         ],
+        ids=param_id,
     )
     def test_dataset(self, dataset, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(data=dataset)
+
+    def test_from_json_returns_copies(self, tmp_path) -> None:
+        json_path = tmp_path / "config.json"
+        json_path.write_text(f'{{"data": "{PATH}", "k": 2}}')
+
+        first = AnonymizationConfig.from_json(str(json_path))
+        second = AnonymizationConfig.from_json(str(json_path))
+        assert first == second and first is not second
+
+    def test_from_json_reloads_edited_file(self, tmp_path) -> None:
+        json_path = tmp_path / "config.json"
+        json_path.write_text(f'{{"data": "{PATH}", "k": 2}}')
+        assert AnonymizationConfig.from_json(str(json_path)).k == 2
+
+        json_path.write_text(f'{{"data": "{PATH}", "k": 30}}')
+        assert AnonymizationConfig.from_json(str(json_path)).k == 30
+
+        AnonymizationConfig.clear_cache()
+        assert AnonymizationConfig.from_json(str(json_path)).k == 30
+
+    def test_from_json_checks_files_again(self, tmp_path) -> None:
+        hierarchy_path = tmp_path / "age.csv"
+        hierarchy_path.write_bytes(Path(AGE_PATH).read_bytes())
+        json_path = tmp_path / "config.json"
+        json_path.write_text(
+            f'{{"data": "{PATH}", "quasi_identifiers": ["age"], '
+            f'"hierarchies": {{"age": "{hierarchy_path}"}}}}'
+        )
+        AnonymizationConfig.from_json(str(json_path))
+
+        hierarchy_path.unlink()
+        with pytest.raises(FileNotFoundError):
+            AnonymizationConfig.from_json(str(json_path))
+
+    def test_check_json(self, tmp_path) -> None:
+        json_path = tmp_path / "config.json"
+        json_path.write_text(
+            '{"data": "dummy", "quasi_identifiers": ["age"],'
+            ' "hierarchies": {"age": "dummy"}}'
+        )
+        problems = AnonymizationConfig.check_json(str(json_path))
+        assert [(p["code"], p["path"]) for p in problems] == [
+            ("file_not_found", "data"),
+            ("file_not_found", "hierarchies.age"),
+        ]
+
+        json_path.write_text(f'{{"data": "{PATH}", "k": 0}}')
+        problems = AnonymizationConfig.check_json(str(json_path))
+        assert [(p["code"], p["path"]) for p in problems] == [
+            ("greater_than", "k")
+        ]
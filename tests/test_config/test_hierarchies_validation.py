@@ -1,3 +1,5 @@
+import os
+
 from tests.common import *
 
 
@@ -47,11 +49,77 @@ class TestHierarchies:
                 ValidationError,
             ),
         ],
+        ids=param_id,
     )
     def test_hierarchies(self, hierarchies, quasi_identifiers, error) -> None:
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(
                 data=PATH, 
                 quasi_identifiers=quasi_identifiers,
                 hierarchies=hierarchies
             )
+
+    def test_skip_fs_checks(self) -> None:
+        with config_context(skip_fs_checks=True):
+            config = AnonymizationConfig(
+                data="dummy.csv",
+                quasi_identifiers=["age"],
+                hierarchies={"age": "dummy"},
+            )
+
+        with pytest.raises(FileNotFoundError):
+            config.validate_files()
+        with pytest.raises(FileNotFoundError):
+            AnonymizationConfig(data="dummy.csv")
+
+    @staticmethod
+    def _same_named_hierarchies(tmp_path) -> tuple[Path, Path]:
+        """Writes two different age.csv files with the same mtime."""
+        original = Path(AGE_PATH).read_text()
+        first, second = tmp_path / "first", tmp_path / "second"
+        for directory, top in ((first, "*"), (second, "any")):
+            directory.mkdir()
+            hierarchy = directory / "age.csv"
+            hierarchy.write_text(original.replace(",*\n", f",{top}\n"))
+            os.utime(hierarchy, ns=(0, 0))
+        return first, second
+
+    @pytest.mark.parametrize("backend", ["anjana"])
+    def test_anjana_hierarchy_cache_resolves_relative_paths(
+        self, tmp_path, monkeypatch, backend, require_backend
+    ) -> None:
+        from anonymization_manager.adapters.anjana.anjana import (
+            _load_hierarchies,
+        )
+
+        first, second = self._same_named_hierarchies(tmp_path)
+        tops = []
+        for directory in (first, second):
+            monkeypatch.chdir(directory)
+            levels = _load_hierarchies({"age": "age.csv"})["age"]
+            tops.append(levels[max(levels)].iloc[0])
+        assert tops == ["*", "any"]
+
+
+    @pytest.mark.parametrize("backend", ["arx"])
+    def test_arx_hierarchy_cache_resolves_relative_paths(
+        self, tmp_path, monkeypatch, backend, require_backend
+    ) -> None:
+        from anonymization_manager.adapters.arx.arx import ARXAnonymizer
+
+        ARXAnonymizer._load_arx_library()
+
+        first, second = self._same_named_hierarchies(tmp_path)
+        tops = []
+        for directory in (first, second):
+            monkeypatch.chdir(directory)
+            config = AnonymizationConfig(
+                data=PATH,
+                quasi_identifiers=["age"],
+                hierarchies={"age": "age.csv"},
+            )
+            data = ARXAnonymizer._create_data(config)
+            ARXAnonymizer._define_hierarchies(data, config)
+            levels = data.getDefinition().getHierarchy("age")
+            tops.append(str(levels[0][len(levels[0]) - 1]))
+        assert tops == ["*", "any"]
@@ -1,98 +1,87 @@
 from tests.common import *
 
+# (parameter, value, expected error) for every scalar parameter.
+PARAMETER_CASES = [
+    ("k", None, None),  # Default
+    ("k", 1, None),  # Smallest Valid
+    ("k", 10, None),  # Typical Valid
+    ("k", 50, None),  # Larger Valid
+    ("k", -1, ValidationError),  # Negative
+    ("k", 0, ValidationError),  # Zero
+    ("k", 0.5, ValidationError),  # Float
+    ("k", "10", None),  # String
+    ("k", [], ValidationError),  # List
+    ("l", None, None),  # Default
+    ("l", 1, None),  # Smallest Valid
+    ("l", 10, None),  # Typical Valid
+    ("l", 50, None),  # Larger Valid
+    ("l", -1, ValidationError),  # Negative
+    ("l", 0, ValidationError),  # Zero
+    ("l", 0.5, ValidationError),  # Float
+    ("l", "10", None),  # String
+    ("l", [], ValidationError),  # List
+    ("t", None, None),  # Default
+    ("t", 0.0, None),  # Smallest Valid
+    ("t", 1.0, None),  # Largest Valid
+    ("t", 0.55, None),  # Typical Valid
+    ("t", -1, ValidationError),  # Negative
+    ("t", 2, ValidationError),  # Integer
+    ("t", "0.22", None),  # String
+    ("t", [], ValidationError),  # List
+    ("suppression_limit", None, None),  # Default
+    ("suppression_limit", 10, ValidationError),  # Small Valid
+    ("suppression_limit", 55, ValidationError),  # Typical Valid
+    ("suppression_limit", 88, ValidationError),  # Large Valid
+    ("suppression_limit", 0, None),  # Smallest Valid
+    ("suppression_limit", 1, None),  # Largest Valid
+    ("suppression_limit", 100, ValidationError),  # Largest Valid
+    ("suppression_limit", 0.68, None),  # Float
+    ("suppression_limit", 111, ValidationError),  # Too Large
+    ("suppression_limit", -5, ValidationError),  # Negative
+    ("suppression_limit", "67", ValidationError),  # String
+    ("suppression_limit", [], ValidationError),  # List
+    ("backend", None, None),  # None Is Not Accepted
+    ("backend", "arx", None),  # Arx
+    ("backend", "anjana", None),  # Anjana
+    ("backend", "foo", ValidationError),  # Invalid String
+    ("backend", [], ValidationError),  # List
+]
+
 
 class TestParameters:
     @pytest.mark.parametrize(
-        "k,error",
-        [
-            (None, None),  # Default
-            (1, None),  # Smallest Valid
-            (10, None),  # Typical Valid
-            (50, None),  # Larger Valid
-            (-1, ValidationError),  # Negative
-            (0, ValidationError),  # Zero
-            (0.5, ValidationError),  # Float
-            ("10", None),  # String
-            ([], ValidationError),  # List
+        "name,value,error",
+        PARAMETER_CASES,
+        ids=[
+            f"{name}={param_id(value)}" for name, value, _ in PARAMETER_CASES
         ],
     )
-    def test_k_values(self, k, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
-            config = AnonymizationConfig(data=PATH, k=k)
+    def test_parameter_values(self, name, value, error):
+        with expect_error(error):
+            config = AnonymizationConfig(data=PATH, **{name: value})
 
-    @pytest.mark.parametrize(
-        "l,error",
-        [
-            (None, None),  # Default
-            (1, None),  # Smallest Valid
-            (10, None),  # Typical Valid
-            (50, None),  # Larger Valid
-            (-1, ValidationError),  # Negative
-            (0, ValidationError),  # Zero
-            (0.5, ValidationError),  # Float
-            ("10", None),  # String
-            ([], ValidationError),  # List
-        ],
-    )
-    def test_l_values(self, l, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
-            config = AnonymizationConfig(data=PATH, l=l)
+    def test_backends_registered(self):
+        from typing import get_args
 
-    @pytest.mark.parametrize(
-        "t,error",
-        [
-            (None, None),  # Default
-            (0.0, None),  # Smallest Valid
-            (1.0, None),  # Largest Valid
-            (0.55, None),  # Typical Valid
-            (-1, ValidationError),  # Negative
-            (2, ValidationError),  # Integer
-            ("0.22", None),  # String
-            ([], ValidationError),  # List
-        ],
-    )
-    def test_t_values(self, t, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
-            config = AnonymizationConfig(data=PATH, t=t)
+        from anonymization_manager.config import BackendType
+        from anonymization_manager.core import _BACKENDS
 
-    @pytest.mark.parametrize(
-        "suppression_limit,error",
-        [
-            (None, None),  # Default
-            (10, ValidationError),  # Small Valid
-            (55, ValidationError),  # Typical Valid
-            (88, ValidationError),  # Large Valid
-            (0, None),  # Smallest Valid
-            (1, None),  # Largest Valid
-            (100, ValidationError),  # Largest Valid
-            (0.68, None),  # Float
-            (111, ValidationError),  # Too Large
-            (-5, ValidationError),  # Negative
-            ("67", ValidationError),  # String
-            ([], ValidationError),  # List
-        ],
-    )
-    def test_suppression_values(self, suppression_limit, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
-            config = AnonymizationConfig(
-                data=PATH, suppression_limit=suppression_limit
-            )
+        assert set(_BACKENDS) == set(get_args(BackendType))
 
     @pytest.mark.parametrize(
-        "backend,error",
+        "jvm_options,error",
         [
-            (None, None),  # None Is Not Accepted
-            ("arx", None),  # Arx
-            ("anjana", None),  # Anjana
-            ("foo", ValidationError),  # Invalid String
-            ([], ValidationError),  # List
+            (None, None),  # Default
+            ([], None),  # Empty
+            (["-Xmx4g", "-XX:+UseParallelGC"], None),  # Typical Valid
+            ("-Xmx4g", ValidationError),  # Single String
+            ([1], ValidationError),  # Non-String Option
         ],
+        ids=param_id,
     )
-    def test_backend_values(self, backend, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
-            config = AnonymizationConfig(
-                data=PATH, backend=backend
-            )
+    def test_jvm_options(self, jvm_options, error):
+        with expect_error(error):
+            config = AnonymizationConfig(data=PATH, jvm_options=jvm_options)
 
     @pytest.mark.parametrize(
         "attribute_weights,error",
@@ -103,9 +92,10 @@ class TestParameters:
             ({"foo":-0.5}, ValidationError), # Negative weight not allowed
             ({"foo":2, "bar":0.2}, None), # Valid weights
         ],
+        ids=param_id,
     )
     def test_attribute_weights(self, attribute_weights, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(
                 data=PATH, 
                 attribute_weights=attribute_weights, 
@@ -128,7 +118,7 @@ class TestParameters:
         ("normalized-entropy", None),
     ])
     def test_quality_metrics(self, metric, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(
                 data=PATH, 
                 quality_metric={"name":metric},
@@ -146,11 +136,81 @@ class TestParameters:
         ("normalized-entropy", 0.44, None),
     ])
     def test_quality_metrics_with_gs_factor(self, metric, gs_factor, error):
-        with pytest.raises(error) if error else contextlib.nullcontext():
+        with expect_error(error):
             config = AnonymizationConfig(
                 data=PATH, 
                 quality_metric={"name":metric, "params":{"gs_factor":gs_factor}},
                 backend="arx"
             )
 
-   
\ No newline at end of file
+   
+    def test_frozen_and_hashable(self):
+        config = AnonymizationConfig(data=PATH, k=2)
+        same = AnonymizationConfig(data=PATH, k=2)
+
+        assert hash(config) == hash(same)
+        assert {config: True}[same]
+        with pytest.raises(ValidationError):
+            config.k = 3
+
+    def test_equal_after_hashing(self):
+        config = AnonymizationConfig(data=PATH, k=2)
+        same = AnonymizationConfig(data=PATH, k=2)
+
+        hash(config)
+        assert config == same and same == config
+        assert config != config.replace(k=3)
+
+    def test_copy_with_update_after_hashing(self):
+        config = AnonymizationConfig(data=PATH, k=2)
+        hash(config)
+
+        updated = config.model_copy(update={"k": 5})
+        assert updated != config
+        assert updated == AnonymizationConfig(data=PATH, k=5)
+        assert hash(updated) == hash(AnonymizationConfig(data=PATH, k=5))
+
+    def test_containers_immutable(self):
+        config = AnonymizationConfig(
+            data=PATH,
+            quasi_identifiers=["age"],
+            hierarchies={"age": AGE_PATH},
+        )
+        expected = hash(config)
+
+        with pytest.raises(AttributeError):
+            config.quasi_identifiers.append("sex")
+        with pytest.raises(TypeError):
+            config.hierarchies["sex"] = SEX_PATH
+        assert hash(config) == expected
+        assert config.model_dump()["hierarchies"] == {"age": AGE_PATH}
+
+    def test_picklable(self):
+        import copy
+        import pickle
+
+        config = AnonymizationConfig(
+            data=PATH,
+            quasi_identifiers=["age"],
+            hierarchies={"age": AGE_PATH},
+            attribute_weights={"age": 0.5},
+        )
+
+        assert pickle.loads(pickle.dumps(config)) == config
+        assert copy.deepcopy(config) == config
+        assert config.model_copy(deep=True) == config
+
+    def test_dataframe_compared_by_identity(self, adult_df):
+        config = AnonymizationConfig(data=adult_df)
+
+        assert config == AnonymizationConfig(data=adult_df)
+        assert config != AnonymizationConfig(data=adult_df.copy())
+
+    def test_replace(self):
+        config = AnonymizationConfig(data=PATH, k=2)
+
+        replaced = config.replace(k=5)
+        assert replaced.k == 5 and config.k == 2
+        assert replaced.data == config.data
+        with pytest.raises(ValidationError):
+            config.replace(k=0)
@@ -0,0 +1,61 @@
+from tests.common import *
+
+
+class TestEquivalenceClasses:
+    @pytest.mark.parametrize("k", [(2), (10)])
+    def test_anjana_equivalence_classes(self, k) -> None:
+        config = AnonymizationConfig(
+            data=PATH,
+            identifiers=["education-num"],
+            quasi_identifiers=[
+                "age",
+                "native-country",
+                "race",
+                "sex",
+                "marital-status",
+                "occupation",
+                "workclass",
+                "education",
+            ],
+            hierarchies=HIERARCHIES,
+            k=k,
+            backend="anjana",
+        )
+
+        data = AnonymizationManager.anonymize(config)
+        df = data.get_anonymized_data_as_dataframe()
+        sizes = group_classes(df, config.quasi_identifiers).size()
+
+        # Checks the statistics against a plain groupby.
+        assert data.get_number_of_equivalence_classes() == len(sizes)
+        assert data.get_max_equivalence_class_size() == sizes.max()
+        assert data.get_min_equivalence_class_size() == sizes.min()
+        assert data.get_min_equivalence_class_size() >= k
+        assert data.get_average_equivalence_class_size() == pytest.approx(
+            sizes.mean()
+        )
+        assert data.get_discernibility_metric() == (sizes**2).sum()
+
+        # Checks the suppression count against the original dataset.
+        raw = data.get_raw_data_as_dataframe()
+        assert data.get_number_of_suppressed_records() == len(raw) - len(df)
+
+    def test_anjana_equivalence_classes_all_suppressed(self) -> None:
+        config = AnonymizationConfig(
+            data=PATH,
+            quasi_identifiers=["age", "sex"],
+            hierarchies={"age": AGE_PATH, "sex": SEX_PATH},
+            k=40000,
+            suppression_limit=1.0,
+            backend="anjana",
+        )
+
+        # No k-anonymous release exists, so every record is suppressed.
+        data = AnonymizationManager.anonymize(config)
+        assert data.get_anonymized_data_as_dataframe().empty
+
+        assert data.get_number_of_equivalence_classes() == 0
+        assert data.get_max_equivalence_class_size() == 0
+        assert data.get_min_equivalence_class_size() == 0
+        assert data.get_average_equivalence_class_size() == 0.0
+        assert data.get_discernibility_metric() == 0.0
@@ -9,7 +9,10 @@ class TestKAnonymity:
         (5, "loss", {"gs_factor":0.5}),
         (5, "kldivergence", {}),
     ])
-    def test_k_anonymity_valid(self, k, quality_metric, params) -> None:
+    @pytest.mark.parametrize("backend", ["arx"])
+    def test_k_anonymity_valid(
+        self, k, quality_metric, params, backend, require_backend
+    ) -> None:
             config = AnonymizationConfig(
                 data=PATH,
                 identifiers=["education-num"],
@@ -25,27 +28,18 @@ class TestKAnonymity:
                 ],
                 sensitive_attributes=[],
                 insensitive_attributes=[],
-                hierarchies={
-                    "age": AGE_PATH,
-                    "native-country": COUNTRY_PATH,
-                    "race": RACE_PATH,
-                    "sex": SEX_PATH,
-                    "marital-status": MARITAL_PATH,
-                    "occupation": OCCUPATION_PATH,
-                    "workclass": WORK_CLASS_PATH,
-                    "education": EDUCATION_PATH,
-                },
+                hierarchies=HIERARCHIES,
                 k=k,
                 quality_metric={"name":quality_metric, "params":params},
-                backend="arx",
+                backend=backend,
             )
 
             data = AnonymizationManager.anonymize(config)
             df = data.get_anonymized_data_as_dataframe()
 
             # Checks k-anonymity.
-            group_sizes = df.groupby(config.quasi_identifiers).size()
-            assert (group_sizes >= k).all()
+            sizes = group_sizes(df, config.quasi_identifiers)
+            assert (sizes >= k).all()
 
     @pytest.mark.parametrize("k,quality_metric, params", [
         (5, "static", {"monotonic":True}),
@@ -70,16 +64,7 @@ class TestKAnonymity:
                     ],
                     sensitive_attributes=[],
                     insensitive_attributes=[],
-                    hierarchies={
-                        "age": AGE_PATH,
-                        "native-country": COUNTRY_PATH,
-                        "race": RACE_PATH,
-                        "sex": SEX_PATH,
-                        "marital-status": MARITAL_PATH,
-                        "occupation": OCCUPATION_PATH,
-                        "workclass": WORK_CLASS_PATH,
-                        "education": EDUCATION_PATH,
-                    },
+                    hierarchies=HIERARCHIES,
                     k=k,
                     quality_metric={"name":quality_metric, "params":params},
                     backend=backend,